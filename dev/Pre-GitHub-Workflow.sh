@@ -50,6 +50,7 @@ IGNORE_NAMES=$(cat << EOF
   focusInEvent
   focusOutEvent
   bgcolor
+  pos
   keyPressEvent
   setData
   flags
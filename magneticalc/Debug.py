@@ -66,6 +66,7 @@ class Debug:
             self,
             obj: object,
             text: str,
+            *args: object,
             color: Optional[Style] = None,
             force: bool = False,
             success: bool = False,
@@ -79,6 +80,8 @@ class Debug:
 
         @param obj: Class instance
         @param text: Debug message
+        @param args: Arguments to format the debug message with (using L{str.format}); formatting is deferred until the
+                     message is actually displayed, so that suppressed messages don't pay for it
         @param color: Color (may be None)
         @param force: Enable to override whitelist
         @param success: Enable to set color=SuccessColor
@@ -136,4 +139,7 @@ class Debug:
         if error:
             color = self.ErrorColor
 
+        if args:
+            text = text.format(*args)
+
         print(self.LightColor + hierarchy + fg.rs + color + ef.bold + name + ef.rs + text + fg.rs + "\n", end="")
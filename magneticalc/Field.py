@@ -215,20 +215,18 @@ class Field(Validatable):
             sampling_volume_points: np.ndarray,
             field_vectors: np.ndarray,
             line_pairs: np.ndarray,
-            head_points: np.ndarray,
             arrow_scale: float,
             magnitude_limit: float
-    ) -> Tuple[np.ndarray, np.ndarray]:
+    ) -> np.ndarray:
         """
         Returns the field arrow parameters needed by L{VisPyCanvas}.
 
         @param sampling_volume_points: Sampling volume points
         @param field_vectors: Field vectors
-        @param line_pairs: Arrow line pairs (ordered list of arrow start/stop 3D points)
-        @param head_points: Arrow head points (ordered list of arrow stop 3D points)
+        @param line_pairs: Arrow line pairs (ordered list of arrow start/stop 3D points); output buffer
         @param arrow_scale: Arrow scale
         @param magnitude_limit: Magnitude limit (mitigating divisions by zero)
-        @return: Line pairs, head points
+        @return: Line pairs; the arrow head points are the stop points, i.e. "line_pairs[1::2]"
         """
         for i in prange(len(field_vectors)):
 
@@ -239,16 +237,13 @@ class Field(Validatable):
             if field_vector_length < magnitude_limit:
                 field_vector_length = magnitude_limit
 
-            # Calculate normalized field direction
-            field_direction_norm = field_vectors[i] / field_vector_length
+            # Calculate scale mapping the field vector to the arrow start & end offsets (avoiding temporary arrays)
+            scale = arrow_scale / 2 / 2 / field_vector_length
 
-            # Calculate arrow start & end coordinates
-            p_start = sampling_volume_points[i] + field_direction_norm / 2 / 2 * arrow_scale
-            p_end = sampling_volume_points[i] - field_direction_norm / 2 / 2 * arrow_scale
+            # Populate arrow line (start & end) coordinates
+            for j in range(3):
+                offset = field_vectors[i][j] * scale
+                line_pairs[2 * i + 0][j] = sampling_volume_points[i][j] + offset
+                line_pairs[2 * i + 1][j] = sampling_volume_points[i][j] - offset
 
-            # Populate arrow line & head coordinates
-            line_pairs[2 * i + 0] = p_start
-            line_pairs[2 * i + 1] = p_end
-            head_points[i] = p_end
-
-        return line_pairs, head_points
+        return line_pairs
@@ -19,9 +19,10 @@
 from __future__ import annotations
 import qtawesome as qta
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QMenu, QFileDialog
+from PyQt5.QtWidgets import QMenu, QFileDialog, QMessageBox
 from magneticalc.QtWidgets2.QSaveAction import QSaveAction
 from magneticalc.Debug import Debug
+from magneticalc.QMessageBox2 import QMessageBox2
 from magneticalc.ExportContainer_Dialog import ExportContainer_Dialog
 
 
@@ -99,6 +100,8 @@ class File_Menu(QMenu):
             Qt.CTRL + Qt.Key_Q
         )
 
+        self.gui.image_saved.connect(self.on_image_saved)  # type: ignore
+
     def update(self):
         """
         Updates the menu.
@@ -189,3 +192,21 @@ class File_Menu(QMenu):
         )
         if action.filename:
             self.gui.vispy_canvas.save_image(action.filename)
+
+    def on_image_saved(self, filename: str, error: str) -> None:
+        """
+        Gets called when an exported image was saved, or failed to be saved.
+
+        @param filename: Filename
+        @param error: Error message (empty string if the image was saved successfully)
+        """
+        if not error:
+            return
+
+        QMessageBox2(
+            title="Export Image",
+            text=f"Could not save image:\n{filename}\n\n{error}",
+            icon=QMessageBox.Warning,
+            buttons=QMessageBox.Ok,
+            default_button=QMessageBox.Ok
+        )
@@ -52,6 +52,9 @@ class GUI(QMainWindow):
     # Used by ModelAccess to invalidate the statusbar
     invalidate_statusbar = pyqtSignal()
 
+    # This signal is fired from the image writer thread of VisPyCanvas (filename, error message or empty string)
+    image_saved = pyqtSignal(str, str)
+
     def __init__(self) -> None:
         """
         Initializes the GUI.
@@ -327,5 +330,9 @@ class GUI(QMainWindow):
         else:
             Debug(self, ".quit(): Called from calculation thread (assertion failed)")
 
+        # Wait for any pending image export to finish (the canvas may not exist yet if an assertion failed early)
+        if hasattr(self, "vispy_canvas"):
+            self.vispy_canvas.cleanup()
+
         print()
         print("Goodbye!")
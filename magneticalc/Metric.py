@@ -481,20 +481,22 @@ class Metric(Validatable):
 
     @staticmethod
     @ConditionalDecorator(get_jit_enabled(), jit, nopython=True, parallel=True)
-    def boost_colors(boost: float, direction: float, colors: np.ndarray) -> np.ndarray:
+    def boost_colors(boost: float, direction: float, colors: np.ndarray, boosted_colors: np.ndarray) -> np.ndarray:
         """
         "Boosts" an array of color values.
 
         @param boost: Boost value
         @param direction: Boost direction
-        @param colors: Colors (ordered list of 4-tuples)
-        @return: Colors (ordered list of 4-tuples)
+        @param colors: Colors (ordered list of 4-tuples); not modified
+        @param boosted_colors: Boosted colors (output buffer, same shape as colors)
+        @return: Boosted colors (ordered list of 4-tuples)
         """
+        color_offset = boost * direction
+
+        # Clamp each component to [0, 1] using scalar operations (avoiding temporary arrays)
         for i in prange(len(colors)):
-            r = np.max(np.array([0.0, np.min(np.array([1.0, colors[i][0] + boost * direction]))]))
-            g = np.max(np.array([0.0, np.min(np.array([1.0, colors[i][1] + boost * direction]))]))
-            b = np.max(np.array([0.0, np.min(np.array([1.0, colors[i][2] + boost * direction]))]))
-            a = np.max(np.array([0.0, np.min(np.array([1.0, colors[i][3] + boost]))]))
-            colors[i] = np.array([r, g, b, a])
+            for j in range(3):
+                boosted_colors[i][j] = max(0.0, min(1.0, colors[i][j] + color_offset))
+            boosted_colors[i][3] = max(0.0, min(1.0, colors[i][3] + boost))
 
-        return colors
+        return boosted_colors
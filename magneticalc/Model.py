@@ -380,7 +380,7 @@ class Model:
         self.gui.sidebar_left.sampling_volume_widget.update()
         self.gui.sidebar_right.display_widget.update()
         self.gui.sidebar_right.display_widget.prevent_excessive_field_labels(choice=False)
-        self.gui.vispy_canvas.redraw()
+        self.gui.vispy_canvas.redraw(self.gui.vispy_canvas.RedrawField)
 
     def on_field_valid(self) -> None:
         """
@@ -389,7 +389,7 @@ class Model:
         Debug(self, ".on_field_valid()")
 
         self.gui.sidebar_right.field_widget.update()
-        self.gui.vispy_canvas.redraw()
+        self.gui.vispy_canvas.redraw(self.gui.vispy_canvas.RedrawField)
 
     def on_metric_valid(self) -> None:
         """
@@ -400,7 +400,7 @@ class Model:
         Debug(self, ".on_metric_valid()")
 
         self.gui.sidebar_right.metric_widget.update()
-        self.gui.vispy_canvas.redraw()
+        self.gui.vispy_canvas.redraw(self.gui.vispy_canvas.RedrawField)
 
     def on_parameters_valid(self) -> None:
         """
@@ -409,7 +409,7 @@ class Model:
         Debug(self, ".on_parameters_valid()")
 
         self.gui.sidebar_right.parameters_widget.update()
-        self.gui.vispy_canvas.redraw()
+        self.gui.vispy_canvas.redraw(self.gui.vispy_canvas.RedrawNone)
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -17,7 +17,6 @@
 #  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from typing import Dict
-import numpy as np
 from magneticalc.Assert_Dialog import Assert_Dialog
 
 
@@ -28,7 +27,7 @@ class Perspective_Presets:
     Isometric = {
         "id": "Isometric",
         "azimuth": 135.0,
-        "elevation": round(np.arctan(1 / np.sqrt(2)) * 180 / np.pi, 4)
+        "elevation": 35.2644  # = arctan(1 / sqrt(2)) in degrees, rounded to 4 decimals
     }
 
     # Preset: XY-plane
@@ -74,6 +74,7 @@ class Perspective_Widget(QGroupBox2):
         Debug(self, ".set_perspective()")
         self.gui.project.set_float("azimuth", preset["azimuth"])
         self.gui.project.set_float("elevation", preset["elevation"])
-        self.gui.vispy_canvas.view_main.camera.azimuth = preset["azimuth"]
-        self.gui.vispy_canvas.view_main.camera.elevation = preset["elevation"]
-        self.gui.redraw()
+
+        # Apply the new perspective with a single perspective change (the scene itself doesn't need to be redrawn)
+        self.gui.vispy_canvas.load_perspective(redraw=False)
+        self.gui.vispy_canvas.on_perspective_changed()
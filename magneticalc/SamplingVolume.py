@@ -41,7 +41,8 @@ class SamplingVolume(Validatable):
 
         self._points = np.array([])
         self._permeabilities = np.array([])
-        self._labeled_indices: List = []
+        self._labeled_points = np.array([])
+        self._labeled_field_indices = np.array([], dtype=int)
         self._neighbor_indices: List[np.ndarray] = []
 
         self.resolution = 0
@@ -181,7 +182,10 @@ class SamplingVolume(Validatable):
         total_points = np.zeros(shape=(total_count, 3))
         total_permeabilities = np.zeros(total_count)
         total_neighbor_indices = np.zeros(shape=(total_count, 6), dtype=int)
-        labeled_indices = []
+
+        # Precompute which grid points to label, providing orthogonal spacing between labels
+        total_xyz = np.indices(self._dimension).reshape(3, -1, order="F")  # 3D indices of all grid points
+        total_labeled = np.all(np.fmod(total_xyz, self.resolution / self._label_resolution) == 0, axis=0)
 
         # Linearly iterate through all possible grid points, computing the 3D cartesian ("euclidean") product
         for i in range(total_count):
@@ -213,14 +217,6 @@ class SamplingVolume(Validatable):
                 ]
                 total_neighbor_indices[i] = neighborhood
 
-                # Provide orthogonal spacing between labels
-                if \
-                        np.fmod(x, self.resolution / self._label_resolution) == 0 and \
-                        np.fmod(y, self.resolution / self._label_resolution) == 0 and \
-                        np.fmod(z, self.resolution / self._label_resolution) == 0:
-                    # Generate a label at this point
-                    labeled_indices.append([point, i])
-
             # Signal progress update, handle interrupt (every 256 iterations to keep overhead low)
             if i & 0xff == 0:
                 progress_callback(100 * (i + 1) / total_count)
@@ -273,15 +269,16 @@ class SamplingVolume(Validatable):
 
         # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-        # Translate label indices
-        for i in range(len(labeled_indices)):
-            labeled_indices[i][1] = index_all_to_filtered[labeled_indices[i][1]]
+        # Select the included points to label; translate their indices
+        labeled_indices = np.flatnonzero(total_labeled & (total_permeabilities != 0))
+        labeled_field_indices = np.array(index_all_to_filtered, dtype=int)[labeled_indices]
 
         # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
         self._points = np.array(points_filtered)
         self._permeabilities = np.array(permeabilities_filtered)
-        self._labeled_indices = labeled_indices
+        self._labeled_points = total_points[labeled_indices]
+        self._labeled_field_indices = labeled_field_indices
         self._neighbor_indices = np.array(neighbor_indices_filtered)
 
         Debug(
@@ -295,7 +292,8 @@ class SamplingVolume(Validatable):
             origin = np.zeros(3)
             self._points = np.array([origin])
             self._permeabilities = np.array([0])
-            self._labeled_indices = [(origin, 0)]
+            self._labeled_points = np.array([origin])
+            self._labeled_field_indices = np.array([0], dtype=int)
             self._neighbor_indices = np.array([[0, 0, 0, 0, 0, 0]])
 
         progress_callback(100)
@@ -342,13 +340,23 @@ class SamplingVolume(Validatable):
 
     @property
     @require_valid
-    def labeled_indices(self) -> List:
+    def labeled_points(self) -> np.ndarray:
+        """
+        Returns this sampling volume's labeled points.
+
+        @return: Array of 3D points (same order as L{labeled_field_indices})
+        """
+        return self._labeled_points
+
+    @property
+    @require_valid
+    def labeled_field_indices(self) -> np.ndarray:
         """
-        Returns this sampling volume's labeled indices.
+        Returns the field indices of this sampling volume's labeled points.
 
-        @return: Unordered list of pairs [sampling volume point, field index]
+        @return: Array of field (vector) indices (same order as L{labeled_points})
         """
-        return self._labeled_indices
+        return self._labeled_field_indices
 
     @property
     @require_valid
@@ -358,7 +366,7 @@ class SamplingVolume(Validatable):
 
         @return: Label count
         """
-        return len(self._labeled_indices)
+        return len(self._labeled_field_indices)
 
     @property
     @require_valid
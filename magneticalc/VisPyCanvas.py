@@ -17,10 +17,12 @@
 #  OR IN CONNECTION WITH THE USE OR PERFORMANCE OF THIS SOFTWARE.
 
 from __future__ import annotations
+import math
 import time
+from concurrent.futures import ThreadPoolExecutor, Future
 import numpy as np
-from typing import Optional
-from si_prefix import si_format
+from typing import Optional, Dict, Any, List
+from PyQt5.QtCore import QTimer
 from vispy import io, scene, visuals
 from vispy.scene.cameras import TurntableCamera
 from vispy.visuals.visual import Visual
@@ -43,9 +45,13 @@ class VisPyCanvas(scene.SceneCanvas):
     # Enable to additionally debug perspective changes
     DebugPerspective = False
 
-    # Base colors
-    White = np.array([1, 1, 1, 1])
-    Black = np.array([0, 0, 0, 1])
+    # Base colors (float32, like all arrays passed to VisPy)
+    White = np.array([1, 1, 1, 1], dtype=np.float32)
+    Black = np.array([0, 0, 0, 1], dtype=np.float32)
+
+    # Perspective info colors (semi-transparent foreground colors)
+    WhitePerspectiveInfo = np.array([1, 1, 1, .6], dtype=np.float32)
+    BlackPerspectiveInfo = np.array([0, 0, 0, .6], dtype=np.float32)
 
     # Display settings
     FieldArrowHeadSize = 10
@@ -54,15 +60,29 @@ class VisPyCanvas(scene.SceneCanvas):
     WirePointSelectedSize = 10
     WirePointSelectedColor = (1, 0, 0)
 
+    # Minimum interval (ms) between perspective info updates during continuous perspective changes
+    PerspectiveInfoInterval = 33
+
+    # Redraw flags, selecting which parts of the scene need to be redrawn; see: "redraw()"
+    RedrawNone = 0
+    RedrawWire = 1 << 0
+    RedrawField = 1 << 1
+    RedrawAll = RedrawWire | RedrawField
+
     # Zoom limits
     ScaleFactorMin = 1e-3
     ScaleFactorMax = 1e+4
 
+    # Zoom limits (logarithmic), used for calculating the linearized zoom value
+    ScaleFactorLogMin = math.log10(ScaleFactorMin)
+    ScaleFactorLogRange = math.log10(ScaleFactorMax) - ScaleFactorLogMin
+
     # Magnitude limit (mitigating divisions by zero)
     MagnitudeLimit = 1e-12
 
     # Formatting settings
     MagnitudePrecision = 1
+    SIPrefixes = "yzafpnµm kMGTPEZY"  # SI prefixes for exponents -24, -21, …, +24 (as used by the "si_prefix" package)
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -84,6 +104,9 @@ class VisPyCanvas(scene.SceneCanvas):
 
         self.redraw_start_time: Optional[float] = None
 
+        # Worker thread for writing image files; see: "save_image()"
+        self._image_writer = ThreadPoolExecutor(max_workers=1)
+
         self.view_main = self.central_widget.add_view()
         self.view_text = self.view_main.add_view()
 
@@ -105,8 +128,46 @@ class VisPyCanvas(scene.SceneCanvas):
             font_size=self.DefaultFontSize,
             font_manager=self.font_manager
         )
+        self._perspective_info: Optional[str] = None  # Perspective info text that was last drawn
+
+        # Coalesces perspective info updates while the camera is being moved; see: "on_perspective_changed()"
+        self._perspective_info_timer = QTimer()
+        self._perspective_info_timer.setSingleShot(True)
+        self._perspective_info_timer.setInterval(self.PerspectiveInfoInterval)
+        self._perspective_info_timer.timeout.connect(self.redraw_perspective_info)
+
+        # Single visual holding all field labels; it is reused (i.e. updated) whenever labels are re-created
+        # See: "create_field_labels()", "delete_field_labels()", "redraw_field_labels()"
+        self.visual_field_labels = scene.visuals.create_visual_node(visuals.TextVisual)(
+            face=self.DefaultFontFace,
+            font_size=self.DefaultFontSize,
+            font_manager=self.font_manager
+        )
+        self._field_labels_created = False
+        self._label_colors_source = None  # Colors that the field labels were last colored with
+
+        # Field arrow buffers, reused across redraws as long as the number of sampling volume points doesn't change
+        self._line_pairs: Optional[np.ndarray] = None
+        self._head_points: Optional[np.ndarray] = None  # View of the arrow stop points in "_line_pairs"
+        self._arrows_source: Optional[tuple] = None  # Points, vectors and scale the arrow buffers were calculated from
+        self._line_colors: Optional[np.ndarray] = None
+        self._line_colors_source = None  # Colors that "_line_colors" was last populated from
+
+        # Data most recently passed to each visual; see: "set_visual_data()"
+        self._visual_data: Dict[int, Dict[str, Any]] = {}
 
-        self.visual_field_labels = []  # See: "create_field_labels()", "delete_field_labels()", "redraw_field_labels()"
+        # Boosted metric colors, reused as long as the metric colors and the boost parameters don't change
+        self._boosted_colors: Optional[np.ndarray] = None
+        self._boosted_colors_source = None  # Metric colors that "_boosted_colors" was last calculated from
+        self._boosted_colors_parameters: Optional[tuple] = None  # Boost and direction used for "_boosted_colors"
+
+        # Foreground colors for all sampling volume points, reused as long as the foreground and the count don't change
+        self._foreground_colors: Optional[np.ndarray] = None
+        self._foreground_colors_source: Optional[np.ndarray] = None  # Foreground color "_foreground_colors" is from
+
+        # Selected wire points, reused as long as the transformed wire points and the selected point don't change
+        self._wire_points_selected: Optional[np.ndarray] = None
+        self._wire_points_selected_source: Optional[tuple] = None  # Points and index "_wire_points_selected" is from
 
         # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
@@ -119,32 +180,35 @@ class VisPyCanvas(scene.SceneCanvas):
         self.visual_field_arrow_lines = scene.visuals.create_visual_node(visuals.LineVisual)()
         self.visual_field_arrow_heads = scene.visuals.create_visual_node(visuals.MarkersVisual)()
 
+        # Attach all scene visuals once (in drawing order); they are then only shown or hidden, see: "set_visible()"
+        for visual in [
+            self.visual_coordinate_system,
+            self.visual_wire_segments,
+            self.visual_wire_points_sliced,
+            self.visual_wire_points_selected,
+            self.visual_field_arrow_lines,
+            self.visual_field_arrow_heads,
+            self.visual_field_points,
+            self.visual_field_labels
+        ]:
+            visual.visible = False
+            visual.parent = self.view_main.scene
+
         if self.DebugVisuals:
-            Debug(self, f": visual_wire_segments        =    {self.visual_wire_segments}")
-            Debug(self, f": visual_wire_points_selected = {self.visual_wire_points_selected}")
-            Debug(self, f": visual_wire_points_sliced   = {self.visual_wire_points_sliced}")
-            Debug(self, f": visual_field_points         = {self.visual_field_points}")
-            Debug(self, f": visual_field_arrow_lines    =    {self.visual_field_arrow_lines}")
-            Debug(self, f": visual_field_arrow_heads    = {self.visual_field_arrow_heads}")
-
-        self.foreground = None
-        self.background = None
+            Debug(self, ": visual_wire_segments        =    {}", self.visual_wire_segments)
+            Debug(self, ": visual_wire_points_selected = {}", self.visual_wire_points_selected)
+            Debug(self, ": visual_wire_points_sliced   = {}", self.visual_wire_points_sliced)
+            Debug(self, ": visual_field_points         = {}", self.visual_field_points)
+            Debug(self, ": visual_field_arrow_lines    =    {}", self.visual_field_arrow_lines)
+            Debug(self, ": visual_field_arrow_heads    = {}", self.visual_field_arrow_heads)
+
+        self.dark_background = False
+        self.foreground: Optional[np.ndarray] = None
+        self.background: Optional[np.ndarray] = None
         self.update_color_scheme()
 
         self.initializing = False
-        self.visual_startup_info = scene.visuals.create_visual_node(visuals.TextVisual)(
-            parent=self.view_text.scene,
-            pos=(10, 10 + 2 * self.DefaultFontSize),
-            anchor_x="left",
-            anchor_y="bottom",
-            bold=True,
-            text="Performing initial just-in-time compilation;\n"
-                 "subsequent calculations will execute faster!\n",
-            color=(1, .55, 0),  # Orange
-            face=self.DefaultFontFace,
-            font_size=self.DefaultFontSize,
-            font_manager=self.font_manager
-        )
+        self.visual_startup_info: Optional[Visual] = None  # Only while initializing, see: "redraw_startup_info()"
 
         # Insert perspective change handler
         self.signals_blocked = False
@@ -160,19 +224,69 @@ class VisPyCanvas(scene.SceneCanvas):
         Debug(self, ".update_color_scheme()")
 
         dark_background = self.gui.project.get_bool("dark_background")
-        self.foreground = self.White if dark_background else self.Black
-        self.background = self.Black if dark_background else self.White
+
+        # Skip this if the color scheme didn't change since last update
+        if self.foreground is not None and dark_background == self.dark_background:
+            return
+        self.dark_background = dark_background
+
+        if self.dark_background:
+            self.foreground, self.background, perspective_info_color = \
+                self.White, self.Black, self.WhitePerspectiveInfo
+        else:
+            self.foreground, self.background, perspective_info_color = \
+                self.Black, self.White, self.BlackPerspectiveInfo
+
         self.bgcolor = self.background
-        self.visual_perspective_info.color = np.append(self.foreground[:3], 0.6)
+        self.visual_perspective_info.color = perspective_info_color
 
     def set_visible(self, visual: Visual, is_visible: bool) -> None:
         """
         Sets some visual's visibility.
 
+        The visual stays attached to the scene, which is cheaper than detaching and re-attaching it.
+
         @param visual: Visual
         @param is_visible: Visibility
         """
-        visual.parent = self.view_main.scene if is_visible else None
+        visual.visible = is_visible
+
+    def set_visual_data(self, visual: Visual, **data: Any) -> None:
+        """
+        Sets some visual's data, skipping this if the data is the same as the data that was previously set.
+        This avoids needlessly re-uploading unchanged data to the GPU.
+
+        Note: Arrays and lists are compared by identity, so they must not be modified in-place once passed here.
+
+        @param visual: Visual
+        @param data: Keyword arguments to the visual's "set_data()" method
+        """
+        previous_data = self._visual_data.get(id(visual))
+
+        if previous_data is not None and previous_data.keys() == data.keys() and all(
+                value is previous_data[key] or (
+                    not isinstance(value, (np.ndarray, list)) and
+                    not isinstance(previous_data[key], (np.ndarray, list)) and
+                    value == previous_data[key]
+                )
+                for key, value in data.items()
+        ):
+            if self.DebugVisuals:
+                Debug(self, ".set_visual_data(): Skipped {}", visual)
+            return
+
+        visual.set_data(**data)
+        self._visual_data[id(visual)] = data
+
+    def forget_visual_data(self, *visuals: Visual) -> None:
+        """
+        Forgets the data that was previously set for some visuals, so that the next L{set_visual_data} call won't be
+        skipped. This is needed after modifying a previously set array in-place.
+
+        @param visuals: Visuals
+        """
+        for visual in visuals:
+            self._visual_data.pop(id(visual), None)
 
     def load_perspective(self, redraw: bool = True) -> None:
         """
@@ -204,29 +318,64 @@ class VisPyCanvas(scene.SceneCanvas):
             if self.DebugPerspective:
                 Debug(self, ".on_perspective_changed()")
 
-        # Limit scale factor
-        if self.view_main.camera.scale_factor > self.ScaleFactorMax:
-            self.view_main.camera.scale_factor = self.ScaleFactorMax
-        elif self.view_main.camera.scale_factor < self.ScaleFactorMin:
-            self.view_main.camera.scale_factor = self.ScaleFactorMin
+        camera = self.view_main.camera
+        project = self.gui.project
 
-        if self.view_main.camera.azimuth != self.gui.project.get_float("azimuth"):
-            self.gui.project.set_float("azimuth", self.view_main.camera.azimuth)
+        # Limit scale factor
+        scale_factor = camera.scale_factor
+        if scale_factor > self.ScaleFactorMax:
+            scale_factor = camera.scale_factor = self.ScaleFactorMax
+        elif scale_factor < self.ScaleFactorMin:
+            scale_factor = camera.scale_factor = self.ScaleFactorMin
+
+        azimuth = camera.azimuth
+        if azimuth != project.get_float("azimuth"):
+            project.set_float("azimuth", azimuth)
             if self.DebugPerspective:
-                Debug(self, f".on_perspective_changed(): azimuth = {self.view_main.camera.azimuth}")
+                Debug(self, ".on_perspective_changed(): azimuth = {}", azimuth)
 
-        if self.view_main.camera.elevation != self.gui.project.get_float("elevation"):
-            self.gui.project.set_float("elevation", self.view_main.camera.elevation)
+        elevation = camera.elevation
+        if elevation != project.get_float("elevation"):
+            project.set_float("elevation", elevation)
             if self.DebugPerspective:
-                Debug(self, f".on_perspective_changed(): elevation = {self.view_main.camera.elevation}")
+                Debug(self, ".on_perspective_changed(): elevation = {}", elevation)
 
-        if self.view_main.camera.scale_factor != self.gui.project.get_float("scale_factor"):
-            self.gui.project.set_float("scale_factor", self.view_main.camera.scale_factor)
+        if scale_factor != project.get_float("scale_factor"):
+            project.set_float("scale_factor", scale_factor)
             if self.DebugPerspective:
-                Debug(self, f".on_perspective_changed(): scale_factor = {self.view_main.camera.scale_factor}")
+                Debug(self, ".on_perspective_changed(): scale_factor = {}", scale_factor)
 
         self.super_perspective_changed()
-        self.redraw_perspective_info()
+
+        # Throttle perspective info updates; the pending update draws the latest perspective
+        if not self._perspective_info_timer.isActive():
+            self._perspective_info_timer.start()
+
+    def redraw_startup_info(self) -> None:
+        """
+        Redraws the startup info text.
+
+        The text is only shown during the initial calculation, so its visual is created on demand and released again
+        once initialization is finished.
+        """
+        if self.initializing:
+            if self.visual_startup_info is None:
+                self.visual_startup_info = scene.visuals.create_visual_node(visuals.TextVisual)(
+                    parent=self.view_text,
+                    pos=(10, 10 + 2 * self.DefaultFontSize),
+                    anchor_x="left",
+                    anchor_y="bottom",
+                    bold=True,
+                    text="Performing initial just-in-time compilation;\n"
+                         "subsequent calculations will execute faster!\n",
+                    color=(1, .55, 0),  # Orange
+                    face=self.DefaultFontFace,
+                    font_size=self.DefaultFontSize,
+                    font_manager=self.font_manager
+                )
+        elif self.visual_startup_info is not None:
+            self.visual_startup_info.parent = None
+            self.visual_startup_info = None
 
     def redraw_perspective_info(self) -> None:
         """
@@ -234,24 +383,37 @@ class VisPyCanvas(scene.SceneCanvas):
         """
         visible = self.gui.project.get_bool("show_perspective_info")
 
-        self.visual_perspective_info.parent = self.view_text.scene if visible else None
+        self.visual_perspective_info.visible = visible
 
         if visible:
+            camera = self.view_main.camera
+
             # Calculate linearized zoom value from VisPy "scale factor"
-            zoom_log_range = np.log10(self.ScaleFactorMax) - np.log10(self.ScaleFactorMin)
-            zoom_log_shift = np.log10(self.view_main.camera.scale_factor) - np.log10(self.ScaleFactorMin)
-            zoom = 1000 * (1 - zoom_log_shift / zoom_log_range)
+            zoom_log_shift = math.log10(camera.scale_factor) - self.ScaleFactorLogMin
+            zoom = 1000 * (1 - zoom_log_shift / self.ScaleFactorLogRange)
 
-            self.visual_perspective_info.text = \
-                f"Azimuth: {self.view_main.camera.azimuth:+4.0f} °   " + \
-                f"Elevation: {self.view_main.camera.elevation:+3.0f} °   " + \
+            perspective_info = \
+                f"Azimuth: {camera.azimuth:+4.0f} °   " + \
+                f"Elevation: {camera.elevation:+3.0f} °   " + \
                 f"Zoom: {zoom:4.0f}"
 
-    def redraw(self) -> None:
+            # Skip updating the text if the displayed (i.e. rounded) perspective didn't change
+            if perspective_info == self._perspective_info:
+                return
+            self._perspective_info = perspective_info
+
+            self.visual_perspective_info.text = perspective_info
+
+    def redraw(self, flags: int = RedrawAll) -> None:
         """
         Redraws the canvas.
+
+        The color scheme, startup info, coordinate system and perspective info are always redrawn (this is cheap);
+        the wire and field visuals are only redrawn if selected by the given flags.
+
+        @param flags: Redraw flags (combination of L{RedrawWire}, L{RedrawField}; default: L{RedrawAll})
         """
-        Debug(self, ".redraw()")
+        Debug(self, ".redraw({})", flags)
 
         self.redraw_start_time = time.monotonic()
 
@@ -259,35 +421,75 @@ class VisPyCanvas(scene.SceneCanvas):
 
         if self.gui.model.valid:
             self.initializing = False
-        self.visual_startup_info.parent = self.view_text if self.initializing else None
+        self.redraw_startup_info()
 
         self.set_visible(self.visual_coordinate_system, self.gui.project.get_bool("show_coordinate_system"))
         self.redraw_perspective_info()
 
-        self.redraw_wire_segments()
-        self.redraw_wire_points_sliced()
-        self.redraw_wire_points_selected()
+        # The selected wire point (if any) affects both the wire and the field visuals, so look it up only once
+        point_index = self.gui.sidebar_left.wire_widget.table.get_selected_row() if flags else None
+
+        if flags & self.RedrawWire:
+            self.redraw_wire_segments()
+            self.redraw_wire_points_sliced()
+            self.redraw_wire_points_selected(point_index)
+
+        if flags & self.RedrawField:
+            self.redraw_field(point_index is not None)
+
+        redraw_time = time.monotonic() - self.redraw_start_time
+        Debug(self, ".redraw(): Finished (took {:.2f} s)", redraw_time, success=True)
+
+    # ------------------------------------------------------------------------------------------------------------------
+
+    def redraw_field(self, wire_point_selected: bool) -> None:
+        """
+        Redraws field arrows, points and labels.
+
+        @param wire_point_selected: True if a wire point is selected (hiding the field)
+        """
+        metric = self.gui.model.metric
+        sampling_volume = self.gui.model.sampling_volume
 
         # Determine which field colors to use (if at all)
-        if self.gui.model.metric.valid:
+        if metric.valid:
             # Use metric colors
             boost = self.gui.project.get_float("field_boost")
-            direction = 1 if self.gui.project.get_bool("dark_background") else -1
-            colors = Metric.boost_colors(boost, direction, self.gui.model.metric.colors.copy())
+            direction = 1 if self.dark_background else -1
+            metric_colors = metric.colors
+            if \
+                    metric_colors is not self._boosted_colors_source or \
+                    (boost, direction) != self._boosted_colors_parameters:
+                # Allocate a new array, so that an unchanged array identity means unchanged colors
+                self._boosted_colors = Metric.boost_colors(
+                    boost,
+                    direction,
+                    metric_colors,
+                    np.empty_like(metric_colors, dtype=np.float32)
+                )
+                self._boosted_colors_source = metric_colors
+                self._boosted_colors_parameters = boost, direction
+            colors = self._boosted_colors
         else:
-            if self.gui.model.sampling_volume.valid:
+            if sampling_volume.valid:
                 # Use foreground color for all arrows and points
-                colors = [self.foreground] * self.gui.model.sampling_volume.points_count
+                # The foreground color is always one of the (constant) White and Black arrays, so compare by identity
+                foreground = self.foreground
+                assert foreground is not None, "Color scheme not initialized"
+                if \
+                        self._foreground_colors is None or \
+                        len(self._foreground_colors) != sampling_volume.points_count or \
+                        foreground is not self._foreground_colors_source:
+                    self._foreground_colors = np.tile(foreground, (sampling_volume.points_count, 1))
+                    self._foreground_colors_source = foreground
+                colors = self._foreground_colors
             else:
                 # Dummy argument (not accessed by redraw_field_arrows/_points/_labels in this case)
                 colors = None
 
-        self.redraw_field_arrows(colors)
-        self.redraw_field_points(colors)
-        self.redraw_field_labels(colors)
-
-        redraw_time = time.monotonic() - self.redraw_start_time
-        Debug(self, f".redraw(): Finished (took {redraw_time:.2f} s)", success=True)
+        self.redraw_field_arrows(colors, wire_point_selected)
+        self.redraw_field_points(colors, wire_point_selected)
+        self.redraw_field_labels(colors, wire_point_selected)
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -300,11 +502,14 @@ class VisPyCanvas(scene.SceneCanvas):
         self.set_visible(self.visual_wire_segments, visible)
 
         if visible:
+            points_sliced = self.gui.model.wire.points_sliced
+
             if self.DebugVisuals:
-                Debug(self, f".redraw_wire_segments(): pos[{len(self.gui.model.wire.points_sliced)}]")
+                Debug(self, ".redraw_wire_segments(): pos[{}]", len(points_sliced))
 
-            self.visual_wire_segments.set_data(
-                pos=self.gui.model.wire.points_sliced,
+            self.set_visual_data(
+                self.visual_wire_segments,
+                pos=points_sliced,
                 connect="strip",
                 color=self.foreground
             )
@@ -320,11 +525,14 @@ class VisPyCanvas(scene.SceneCanvas):
         self.set_visible(self.visual_wire_points_sliced, visible)
 
         if visible:
+            points_sliced = self.gui.model.wire.points_sliced
+
             if self.DebugVisuals:
-                Debug(self, f".redraw_wire_points_sliced(): pos[{len(self.gui.model.wire.points_sliced)}]")
+                Debug(self, ".redraw_wire_points_sliced(): pos[{}]", len(points_sliced))
 
-            self.visual_wire_points_sliced.set_data(
-                pos=self.gui.model.wire.points_sliced,
+            self.set_visual_data(
+                self.visual_wire_points_sliced,
+                pos=points_sliced,
                 face_color=self.foreground,
                 size=VisPyCanvas.WirePointSize,
                 edge_width=0,
@@ -332,31 +540,39 @@ class VisPyCanvas(scene.SceneCanvas):
                 symbol="disc"
             )
 
-    def redraw_wire_points_selected(self) -> None:
+    def redraw_wire_points_selected(self, point_index: Optional[int]) -> None:
         """
         Redraws selected wire base points.
+
+        @param point_index: Selected wire base point index (None if no point is selected)
         """
-        point_index = self.gui.sidebar_left.wire_widget.table.get_selected_row()
+        wire = self.gui.model.wire
 
         visible = \
-            self.gui.model.wire.valid and \
+            wire.valid and \
             self.gui.project.get_bool("show_wire_points") and \
             point_index is not None
 
         if visible:
-            points_selected = np.array([
-                self.gui.model.wire.points_transformed[i]
-                for i in range(
-                    point_index,
-                    len(self.gui.model.wire.points_transformed) + point_index - 1,
-                    len(self.gui.model.wire.points_base)
-                )
-            ])
+            points_transformed = wire.points_transformed
+
+            # Select every transformed copy of the selected base point (only if the points or the selection changed)
+            if \
+                    self._wire_points_selected_source is None or \
+                    points_transformed is not self._wire_points_selected_source[0] or \
+                    point_index != self._wire_points_selected_source[1]:
+                self._wire_points_selected = points_transformed[
+                    point_index:len(points_transformed) + point_index - 1:len(wire.points_base)
+                ]
+                self._wire_points_selected_source = points_transformed, point_index
+            points_selected = self._wire_points_selected
+            assert points_selected is not None, "Selected wire points not initialized"
 
             if self.DebugVisuals:
-                Debug(self, f".redraw_wire_points_selected(): pos[{len(points_selected)}]")
+                Debug(self, ".redraw_wire_points_selected(): pos[{}]", len(points_selected))
 
-            self.visual_wire_points_selected.set_data(
+            self.set_visual_data(
+                self.visual_wire_points_selected,
                 pos=points_selected,
                 face_color=VisPyCanvas.WirePointSelectedColor,
                 size=VisPyCanvas.WirePointSelectedSize,
@@ -369,48 +585,89 @@ class VisPyCanvas(scene.SceneCanvas):
 
     # ------------------------------------------------------------------------------------------------------------------
 
-    def redraw_field_arrows(self, colors: np.ndarray) -> None:
+    def redraw_field_arrows(self, colors: np.ndarray, wire_point_selected: bool) -> None:
         """
         Redraws field arrows.
 
         @param colors: Colors
+        @param wire_point_selected: True if a wire point is selected (hiding the field)
         """
-        sampling_volume_resolution = self.gui.model.sampling_volume.resolution
+        sampling_volume = self.gui.model.sampling_volume
+        field = self.gui.model.field
+        sampling_volume_resolution = sampling_volume.resolution
         arrow_head_scale = VisPyCanvas.FieldArrowHeadSize * self.gui.project.get_float("field_arrow_head_scale")
         arrow_line_scale = 2 * (1 / sampling_volume_resolution) * self.gui.project.get_float("field_arrow_line_scale")
 
         visible = \
-            self.gui.model.field.valid and \
+            field.valid and \
             (arrow_head_scale > 0 or arrow_line_scale > 0) and \
-            self.gui.sidebar_left.wire_widget.table.get_selected_row() is None
+            not wire_point_selected
 
         if visible:
 
-            line_pairs = np.zeros([2 * self.gui.model.sampling_volume.points_count, 3])
-            head_points = np.zeros([self.gui.model.sampling_volume.points_count, 3])
+            points_count = sampling_volume.points_count
+            points = sampling_volume.points
+            vectors = field.vectors
+
+            # Recalculate arrows only if the points, vectors or the arrow line scale changed since last redraw
+            if \
+                    self._arrows_source is None or \
+                    points is not self._arrows_source[0] or \
+                    vectors is not self._arrows_source[1] or \
+                    arrow_line_scale != self._arrows_source[2]:
+
+                # (Re-)allocate arrow buffer if necessary; it is overwritten entirely by Field.get_arrows()
+                # The arrow heads sit at the arrow stop points, so the head points are simply a view of the line pairs
+                if self._line_pairs is None or len(self._line_pairs) != 2 * points_count:
+                    self._line_pairs = np.empty([2 * points_count, 3], dtype=np.float32)
+                    self._head_points = self._line_pairs[1::2]
+
+                Field.get_arrows(
+                    points,
+                    vectors,
+                    self._line_pairs,
+                    arrow_line_scale,
+                    VisPyCanvas.MagnitudeLimit
+                )
+                self._arrows_source = points, vectors, arrow_line_scale
+
+                # The buffer was modified in-place
+                self.forget_visual_data(self.visual_field_arrow_lines, self.visual_field_arrow_heads)
 
-            line_pairs, head_points = Field.get_arrows(
-                self.gui.model.sampling_volume.points,
-                self.gui.model.field.vectors,
-                line_pairs,
-                head_points,
-                arrow_line_scale,
-                VisPyCanvas.MagnitudeLimit
-            )
+            # Duplicate colors for both line pair points; skip this if the colors haven't changed since last redraw
+            if colors is not self._line_colors_source:
+                if self._line_colors is None or len(self._line_colors) != 2 * points_count:
+                    self._line_colors = np.empty([2 * points_count, 4], dtype=np.float32)
+                self._line_colors[0::2] = colors
+                self._line_colors[1::2] = colors
+                self._line_colors_source = colors
+
+                # The buffer was modified in-place
+                self.forget_visual_data(self.visual_field_arrow_lines)
+
+            line_pairs, head_points = self._line_pairs, self._head_points
+            assert line_pairs is not None and head_points is not None, "Arrow buffers not allocated"
 
             if self.DebugVisuals:
-                Debug(self, f".redraw_field_arrows(): arrow lines: pos[{len(line_pairs)}] color[{len(colors)}]")
+                Debug(self, ".redraw_field_arrows(): arrow lines: pos[{}] color[{}]", len(line_pairs), len(colors))
 
-            self.visual_field_arrow_lines.set_data(
+            self.set_visual_data(
+                self.visual_field_arrow_lines,
                 pos=line_pairs,
                 connect="segments",
-                color=np.repeat(colors, 2, axis=0)
+                color=self._line_colors
             )
 
             if self.DebugVisuals:
-                Debug(self, f".redraw_field_arrows(): arrow heads: pos[{len(head_points)}] face_color[{len(colors)}]")
+                Debug(
+                    self,
+                    ".redraw_field_arrows(): arrow heads: pos[{}] face_color[{}]",
+                    len(head_points),
+                    len(colors)
+                )
 
-            self.visual_field_arrow_heads.set_data(
+            self.set_visual_data(
+                self.visual_field_arrow_heads,
                 pos=head_points,
                 face_color=colors,
                 size=arrow_head_scale,
@@ -422,29 +679,33 @@ class VisPyCanvas(scene.SceneCanvas):
         self.set_visible(self.visual_field_arrow_lines, visible)
         self.set_visible(self.visual_field_arrow_heads, visible)
 
-    def redraw_field_points(self, colors: np.ndarray) -> None:
+    def redraw_field_points(self, colors: np.ndarray, wire_point_selected: bool) -> None:
         """
         Redraws field points.
 
         @param colors: Colors
+        @param wire_point_selected: True if a wire point is selected (hiding the field)
         """
+        sampling_volume = self.gui.model.sampling_volume
         point_scale = VisPyCanvas.FieldPointSize * self.gui.project.get_float("field_point_scale")
 
         visible = \
-            self.gui.model.sampling_volume.valid and \
+            sampling_volume.valid and \
             point_scale > 0 and \
-            self.gui.sidebar_left.wire_widget.table.get_selected_row() is None
+            not wire_point_selected
 
         if visible:
             if self.DebugVisuals:
                 Debug(
                     self,
-                    ".redraw_field_points(): "
-                    f"pos[{self.gui.model.sampling_volume.points_count}] face_color[{len(colors)}]"
+                    ".redraw_field_points(): pos[{}] face_color[{}]",
+                    sampling_volume.points_count,
+                    len(colors)
                 )
 
-            self.visual_field_points.set_data(
-                pos=self.gui.model.sampling_volume.points,
+            self.set_visual_data(
+                self.visual_field_points,
+                pos=sampling_volume.points,
                 face_color=colors,
                 size=point_scale,
                 edge_width=0,
@@ -459,91 +720,123 @@ class VisPyCanvas(scene.SceneCanvas):
     def create_field_labels(self) -> None:
         """
         Creates field labels.
+
+        All labels are drawn by a single text visual, using one draw call.
         """
-        n = len(self.gui.model.sampling_volume.labeled_indices)
+        sampling_volume = self.gui.model.sampling_volume
+        field = self.gui.model.field
+        labeled_field_indices = sampling_volume.labeled_field_indices
+        n = len(labeled_field_indices)
 
         if self.DebugVisuals:
-            Debug(self, f".create_field_labels(): Creating {n} labels …")
+            Debug(self, ".create_field_labels(): Creating {} labels …", n)
 
         show_gauss = self.gui.project.get_bool("show_gauss")
-        field_units, field_factor = self.gui.model.field.get_units(show_gauss=show_gauss)
-
-        # Iterate through the labeled sampling volume points
-        for i in range(n):
+        field_units, field_factor = field.get_units(show_gauss=show_gauss)
 
-            sampling_volume_point, field_vector_index = self.gui.model.sampling_volume.labeled_indices[i]
-            magnitude = np.linalg.norm(self.gui.model.field.vectors[field_vector_index])
-            if np.isnan(magnitude):
-                text = "NaN"
-            else:
-                text = si_format(
-                    magnitude * field_factor,
-                    precision=VisPyCanvas.MagnitudePrecision,
-                    exp_format_str="{value}e{expof10} "
-                ) + field_units
-
-            visual = scene.visuals.create_visual_node(visuals.TextVisual)(
-                parent=None,
-                pos=sampling_volume_point,
-                face=self.DefaultFontFace,
-                font_size=self.DefaultFontSize,
-                color=self.foreground,
-                text=text,
-                font_manager=self.font_manager
-            )
+        # Calculate all labeled field vector magnitudes at once
+        magnitudes = np.linalg.norm(field.vectors[labeled_field_indices], axis=1) * field_factor
 
-            self.visual_field_labels.append(visual)
+        self.visual_field_labels.text = self.format_magnitudes(magnitudes, field_units)
+        self.visual_field_labels.pos = sampling_volume.labeled_points
+        self.visual_field_labels.color = self.foreground
+        self._label_colors_source = None
+        self._field_labels_created = True
 
         if self.DebugVisuals:
-            Debug(self, f".create_field_labels(): Created {n} labels")
+            Debug(self, ".create_field_labels(): Created {} labels", n)
+
+    @staticmethod
+    def format_magnitudes(magnitudes: np.ndarray, units: str) -> List[str]:
+        """
+        Formats an array of (non-negative) magnitudes using SI prefixes.
+
+        This produces the same output as "si_format(magnitude, precision, exp_format_str="{value}e{expof10} ")" of the
+        "si_prefix" package, but splits all magnitudes into mantissas and exponents at once.
+
+        @param magnitudes: Magnitudes
+        @param units: Units (appended to every formatted magnitude)
+        @return: List of formatted magnitudes ("NaN" for NaN magnitudes)
+        """
+        nan_mask = np.isnan(magnitudes)
+        zero_mask = magnitudes == 0
+
+        # Split magnitudes into mantissas and exponents (multiples of 3); mimics "si_prefix.split()"
+        with np.errstate(divide="ignore", invalid="ignore"):
+            exponents = np.trunc(np.log10(np.where(nan_mask | zero_mask, 1, magnitudes))).astype(int)
+        exponents = np.where(exponents > 0, (exponents // 3) * 3, (-exponents + 3) // 3 * -3)
+        mantissas = magnitudes * 10.0 ** -exponents
+        overflow_mask = mantissas >= 1000
+        mantissas[overflow_mask] /= 1000
+        exponents[overflow_mask] += 3
+        mantissas[zero_mask] = 0
+        exponents[zero_mask] = 0
+
+        prefix_levels = (len(VisPyCanvas.SIPrefixes) - 1) // 2
+        value_format = f"%.{VisPyCanvas.MagnitudePrecision}f"
+
+        texts = []
+        for is_nan, mantissa, exponent in zip(nan_mask.tolist(), mantissas.tolist(), exponents.tolist()):
+            if is_nan:
+                texts.append("NaN")
+            elif abs(exponent // 3) > prefix_levels:
+                texts.append((value_format % mantissa) + f"e{exponent:+d} " + units)
+            else:
+                prefix = VisPyCanvas.SIPrefixes[exponent // 3 + prefix_levels].strip()
+                texts.append((value_format % mantissa) + " " + prefix + units)
+        return texts
 
     def delete_field_labels(self) -> None:
         """
         Deletes the field labels.
         """
-        for visual in self.visual_field_labels:
-            visual.parent = None
+        self.set_visible(self.visual_field_labels, False)
 
-        if self.DebugVisuals:
-            Debug(self, f".delete_field_labels(): Deleted {len(self.visual_field_labels)}")
+        if self.DebugVisuals and self._field_labels_created:
+            Debug(self, ".delete_field_labels(): Deleted {}", len(self.visual_field_labels.text))
 
-        self.visual_field_labels = []
+        self._field_labels_created = False
 
     # - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - - -
 
-    def redraw_field_labels(self, colors) -> None:
+    def redraw_field_labels(self, colors, wire_point_selected: bool) -> None:
         """
         Redraws field labels.
 
         @param colors: Colors
+        @param wire_point_selected: True if a wire point is selected (hiding the field)
         """
         visible = \
             self.gui.model.metric.valid and \
             self.gui.project.get_bool("display_field_magnitude_labels") and \
-            self.gui.sidebar_left.wire_widget.table.get_selected_row() is None
+            not wire_point_selected
 
         if visible:
 
             # Create field labels if necessary
-            if len(self.visual_field_labels) == 0:
+            if not self._field_labels_created:
                 self.create_field_labels()
 
             if self.DebugVisuals:
-                Debug(self, f".redraw_field_labels(): Coloring {len(self.visual_field_labels)}")
+                Debug(self, ".redraw_field_labels(): Coloring {}", len(self.visual_field_labels.text))
 
-            # Update label colors
+            # Update label colors (only if they changed since last redraw)
             show_colored_labels = self.gui.project.get_bool("show_colored_labels")
-            for i in range(len(self.visual_field_labels)):
+            label_colors_source = colors if show_colored_labels else self.foreground
+            if label_colors_source is not self._label_colors_source:
                 if show_colored_labels:
-                    # Use metric color at labeled sampling volume point
-                    _, field_vector_index = self.gui.model.sampling_volume.labeled_indices[i]
-                    self.visual_field_labels[i].color = np.append(colors[field_vector_index][:3], 1.0)
+                    # Use (opaque) metric color at labeled sampling volume point
+                    labeled_field_indices = self.gui.model.sampling_volume.labeled_field_indices
+                    label_colors = np.empty([len(labeled_field_indices), 4], dtype=np.float32)
+                    label_colors[:, :3] = colors[labeled_field_indices, :3]
+                    label_colors[:, 3] = 1.0
+                    self.visual_field_labels.color = label_colors
                 else:
                     # Use foreground color for all labels
-                    self.visual_field_labels[i].color = self.foreground
+                    self.visual_field_labels.color = self.foreground
+                self._label_colors_source = label_colors_source
 
-        for visual in self.visual_field_labels:
-            visual.parent = self.view_main.scene if visible else None
+        self.set_visible(self.visual_field_labels, visible)
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -551,8 +844,36 @@ class VisPyCanvas(scene.SceneCanvas):
         """
         Saves the currently displayed scene to PNG file.
 
+        The scene is rendered immediately, but the (comparatively slow) PNG encoding happens in a worker thread.
+        The result is reported through the "image_saved" signal of the GUI.
+
+        @param filename: Filename
+        """
+        Debug(self, ".save_image({})", filename)
+
+        image = self.render()
+        future = self._image_writer.submit(io.write_png, filename, image)
+        future.add_done_callback(lambda _future_: self.on_image_saved(_future_, filename))
+
+    def on_image_saved(self, future: Future, filename: str) -> None:
+        """
+        Gets called (from the worker thread) when an image was saved, or failed to be saved.
+
+        @param future: Future of the image writer
         @param filename: Filename
         """
-        Debug(self, f".save_image({filename})")
+        exception = future.exception()
+        if exception is not None:
+            Debug(self, ".on_image_saved({}): ERROR: {}", filename, exception, error=True)
+            self.gui.image_saved.emit(filename, str(exception))
+        else:
+            Debug(self, ".on_image_saved({})", filename, success=True)
+            self.gui.image_saved.emit(filename, "")
+
+    def cleanup(self) -> None:
+        """
+        Performs clean-up upon closing the canvas, waiting for any pending image to be written.
+        """
+        Debug(self, ".cleanup()")
 
-        io.write_png(filename, self.render())
+        self._image_writer.shutdown(wait=True)
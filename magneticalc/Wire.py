@@ -82,7 +82,7 @@ class Wire(Validatable):
         axes = self._transform_rotational_symmetry(axes, rotational_symmetry, close_loop=close_loop)
         self.points_transformed = axes.T
 
-        self.bounds = [min(axes[0]), min(axes[1]), min(axes[2])], [max(axes[0]), max(axes[1]), max(axes[2])]
+        self.bounds = np.min(axes, axis=1), np.max(axes, axis=1)
 
         Assert_Dialog(len(self.points_base) >= 2, "Number of points must be >= 2")
 
@@ -96,8 +96,7 @@ class Wire(Validatable):
         @param stretch: XYZ stretch transform factors (3D point)
         @return: Transposed array of Wire points
         """
-        for i in range(3):
-            axes[i] *= stretch[i]
+        axes *= np.asarray(stretch)[:, np.newaxis]
         return axes
 
     @staticmethod
@@ -111,24 +110,29 @@ class Wire(Validatable):
         @param close_loop: Enable to transform the wire into a closed loop (append first point)
         @return: Transposed array of Wire points
         """
-        x, y, z = [], [], []
-
         axis_other_1 = (parameters["axis"] + 1) % 3
         axis_other_2 = (parameters["axis"] + 2) % 3
 
-        for a in np.linspace(0, 2 * np.pi, parameters["count"], endpoint=False):
-            b = a + parameters["offset"] * np.pi / 180
-            x = np.append(x, axes[axis_other_1] * np.sin(b) - (axes[axis_other_2] + parameters["radius"]) * np.cos(b))
-            y = np.append(y, axes[axis_other_1] * np.cos(b) + (axes[axis_other_2] + parameters["radius"]) * np.sin(b))
-            z = np.append(z, axes[parameters["axis"]])
+        # Rotation angles of all replications
+        angles = np.linspace(0, 2 * np.pi, parameters["count"], endpoint=False) + parameters["offset"] * np.pi / 180
+        sin_angles = np.sin(angles)[:, np.newaxis]
+        cos_angles = np.cos(angles)[:, np.newaxis]
+
+        # Axes perpendicular to the rotation axis (shifted by the radius)
+        u = axes[axis_other_1]
+        v = axes[axis_other_2] + parameters["radius"]
 
-        axes = [x, y, z]
+        # Allocate all replications at once (plus the closing point, if needed), then rotate them all at once
+        axes_count = parameters["count"] * axes.shape[1]
+        axes_result = np.empty([3, axes_count + (1 if close_loop else 0)])
+        axes_result[0, :axes_count] = (u * sin_angles - v * cos_angles).ravel()
+        axes_result[1, :axes_count] = (u * cos_angles + v * sin_angles).ravel()
+        axes_result[2, :axes_count] = np.tile(axes[parameters["axis"]], parameters["count"])
 
         if close_loop:
-            for i in range(3):
-                axes[i] = np.append(axes[i], axes[i][0])
+            axes_result[:, axes_count] = axes_result[:, 0]
 
-        return np.array(axes)
+        return axes_result
 
     # ------------------------------------------------------------------------------------------------------------------
 
@@ -142,52 +146,38 @@ class Wire(Validatable):
         """
         Debug(self, ".recalculate()")
 
-        points_sliced = []
-        length = 0
-
-        for i in range(len(self.points_transformed) - 1):
+        points_transformed = self.points_transformed
 
-            # Calculate direction and length of wire segment
-            segment_direction = np.array(self.points_transformed[i + 1] - self.points_transformed[i])
-            segment_length = np.linalg.norm(segment_direction)
-            length += segment_length
+        # Calculate directions and lengths of all wire segments
+        segment_directions = np.diff(points_transformed, axis=0)
+        segment_lengths = np.linalg.norm(segment_directions, axis=1)
 
-            # Calculate required number of slices (subdivisions) and perform linear interpolation
-            slices = np.ceil(segment_length / self._slicer_limit).astype(int)
-            linear = np.linspace(0, 1, slices, endpoint=False)
-            points_sliced += [self.points_transformed[i] + segment_direction * j for j in linear]
+        # Calculate required number of slices (subdivisions) per segment
+        slices = np.ceil(segment_lengths / self._slicer_limit).astype(int)
 
-            # Signal progress update, handle interrupt (every 16 iterations to keep overhead low)
-            if i & 0xf == 0:
-                progress_callback(50 * (i + 1) / (len(self.points_transformed) - 1))
-
-                if QThread.currentThread().isInterruptionRequested():
-                    Debug(self, ".recalculate(): WARNING: Interruption requested, exiting now", warning=True)
-                    return False
+        # Perform linear interpolation for all slices at once:
+        # Slice j of segment i starts at points_transformed[i] + segment_directions[i] * j / slices[i]
+        slice_segments = np.repeat(np.arange(len(slices)), slices)
+        slice_indices = np.arange(len(slice_segments)) - np.repeat(np.cumsum(slices) - slices, slices)
+        linear = slice_indices / slices[slice_segments]
+        points_sliced = \
+            points_transformed[slice_segments] + segment_directions[slice_segments] * linear[:, np.newaxis]
 
         # Append the very last point since it is not appended by the interpolation above
-        points_sliced.append(self.points_transformed[-1])
+        self._points_sliced = np.append(points_sliced, points_transformed[-1:], axis=0)
+        self._length = np.sum(segment_lengths)
 
-        self._points_sliced = np.array(points_sliced)
-        self._length = length
+        # Signal progress update, handle interrupt
+        progress_callback(50)
 
-        # Calculate wire elements: [[element_center, element_direction], …]
-        elements = []
-        for i in range(len(self._points_sliced) - 1):
+        if QThread.currentThread().isInterruptionRequested():
+            Debug(self, ".recalculate(): WARNING: Interruption requested, exiting now", warning=True)
+            return False
 
-            element_direction = np.array(self._points_sliced[i + 1]) - np.array(self._points_sliced[i])
-            element_center = self._points_sliced[i] + element_direction / 2
-            elements.append([element_center, element_direction])
-
-            # Signal progress update, handle interrupt (every 16 iterations to keep overhead low)
-            if i & 0xf == 0:
-                progress_callback(50 + 50 * (i + 1) / (len(self._points_sliced) - 1))
-
-                if QThread.currentThread().isInterruptionRequested():
-                    Debug(self, ".recalculate(): WARNING: Interruption requested, exiting now", warning=True)
-                    return False
-
-        self._elements = np.array(elements)
+        # Calculate wire elements: [[element_center, element_direction], …]
+        element_directions = np.diff(self._points_sliced, axis=0)
+        element_centers = self._points_sliced[:-1] + element_directions / 2
+        self._elements = np.stack([element_centers, element_directions], axis=1)
 
         progress_callback(100)
 